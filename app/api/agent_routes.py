@@ -4,13 +4,28 @@ from app.db.session import get_db
 from app.services.agent_orchestration.gmail_ingestion import GmailIngestion
 from app.services.agent_orchestration.sla_tracker import SLATracker
 from typing import List, Dict
+import threading
 
 router = APIRouter()
-gmail_service = GmailIngestion()
+_gmail_service = None
+_gmail_service_lock = threading.Lock()
+
+def get_gmail_service() -> GmailIngestion:
+    """Create the shared Gmail client on first use"""
+    global _gmail_service
+    if _gmail_service is None:
+        with _gmail_service_lock:
+            if _gmail_service is None:
+                try:
+                    _gmail_service = GmailIngestion()
+                except Exception as e:
+                    raise HTTPException(status_code=500, detail=str(e))
+    return _gmail_service
 
 @router.get("/emails")
 async def get_emails(
     query: str = None,
+    gmail_service: GmailIngestion = Depends(get_gmail_service),
     db: Session = Depends(get_db)
 ):
     """Fetch emails from Gmail"""
@@ -21,13 +36,13 @@ async def get_emails(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/sla/check")
-async def check_sla(
+def check_sla(
     db: Session = Depends(get_db)
 ):
     """Check SLA breaches"""
     try:
         sla_tracker = SLATracker(db)
-        breaches = await sla_tracker.check_sla_breaches()
+        breaches = sla_tracker.check_sla_breaches()
         return {"status": "success", "breaches": breaches}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,6 +4,9 @@ from typing import Optional
 class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str = "sqlite:///./sql_app.db"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800
     
     # API Keys
     OPENAI_API_KEY: str
@@ -11,6 +14,13 @@ class Settings(BaseSettings):
     
     # Gmail API settings
     GMAIL_CREDENTIALS_FILE: Optional[str] = None
+    GMAIL_MAX_CONCURRENT_FETCHES: int = 8
+    GMAIL_MESSAGE_CACHE_SIZE: int = 1024
+    # Timeouts are retried too, so a stalled request can hold a fetch slot for
+    # up to (NUM_RETRIES + 1) * TIMEOUT plus backoff (at most 2 + 4 + 8s for 3
+    # retries): about 54s with these defaults
+    GMAIL_API_TIMEOUT: float = 10.0
+    GMAIL_API_NUM_RETRIES: int = 3
     
     # LangGraph settings
     VECTOR_STORE_PATH: str = "./vector_store"
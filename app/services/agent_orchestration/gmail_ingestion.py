@@ -1,52 +1,148 @@
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from app.config import settings
+from collections import OrderedDict
+import google_auth_httplib2
+import httplib2
+import asyncio
 import base64
 import email
+import logging
+import threading
+import time
+
+logger = logging.getLogger("support_quality_intelligence.gmail_ingestion")
+
+# Partial-response field masks: only what fetch_emails and _parse_message read
+LIST_FIELDS = "messages/id"
+MESSAGE_FIELDS = "id,threadId,payload(headers,parts(mimeType,body/data))"
 
 class GmailIngestion:
     def __init__(self):
-        creds = Credentials.from_authorized_user_file(
+        self.creds = Credentials.from_authorized_user_file(
             settings.GMAIL_CREDENTIALS_FILE,
             ["https://www.googleapis.com/auth/gmail.readonly"]
         )
-        self.service = build("gmail", "v1", credentials=creds)
+        self.service = build("gmail", "v1", credentials=self.creds)
+        # Resource objects are rebuilt from the discovery document on every
+        # call, so build the users().messages() collection once
+        self.messages_resource = self.service.users().messages()
+        # Parsed messages keyed by Gmail message id, least recently used first
+        self._message_cache = OrderedDict()
+        # Per-thread HTTP connections, reused across requests
+        self._local = threading.local()
+        # Serializes token refreshes across overlapping fetch_emails calls
+        self._refresh_lock = asyncio.Lock()
         
     async def fetch_emails(self, query: str = None):
         """Fetch emails from Gmail"""
-        results = (
-            self.service.users()
-            .messages()
-            .list(userId="me", q=query)
-            .execute()
-        )
-        
+        started = time.perf_counter()
+        if not self.creds.valid:
+            # Refresh once, off the event loop, before the concurrent fetches
+            # below would each try to refresh the shared credentials. The
+            # lock and re-check stop overlapping calls refreshing again.
+            async with self._refresh_lock:
+                if not self.creds.valid:
+                    await asyncio.to_thread(self._refresh_credentials)
+        results = await asyncio.to_thread(self._list_messages, query)
+        listed = time.perf_counter()
         messages = results.get("messages", [])
-        emails = []
+        emails = {}
         
         for message in messages:
-            msg = (
-                self.service.users()
-                .messages()
-                .get(userId="me", id=message["id"], format="full")
-                .execute()
-            )
-            emails.append(self._parse_message(msg))
+            cached = self._message_cache.get(message["id"])
+            if cached is not None:
+                self._message_cache.move_to_end(message["id"])
+                emails[message["id"]] = cached
+        
+        missing = [m["id"] for m in messages if m["id"] not in emails]
+        semaphore = asyncio.Semaphore(settings.GMAIL_MAX_CONCURRENT_FETCHES)
+        
+        async def fetch(message_id):
+            async with semaphore:
+                msg = await asyncio.to_thread(self._get_message, message_id)
+            # Cache right away so a failed sibling fetch doesn't discard it
+            emails[message_id] = self._cache_message(message_id, self._parse_message(msg))
+        
+        await asyncio.gather(*(fetch(message_id) for message_id in missing))
             
-        return emails
+        logger.info(
+            "fetch_emails: list=%.1fms get=%.1fms messages=%d fetched=%d cached=%d",
+            (listed - started) * 1000,
+            (time.perf_counter() - listed) * 1000,
+            len(messages),
+            len(missing),
+            len(messages) - len(missing)
+        )
+        # Hand out copies so callers can annotate results without
+        # changing the cached entries
+        return [dict(emails[m["id"]]) for m in messages]
         
-    def _parse_message(self, message):
-        """Parse Gmail message into structured format"""
-        headers = message["payload"]["headers"]
-        subject = next(
-            (h["value"] for h in headers if h["name"].lower() == "subject"),
-            ""
+    def _cache_message(self, message_id, parsed):
+        """Remember a parsed message, evicting the least recently used ones"""
+        # Gmail message content is immutable, so entries never go stale
+        self._message_cache[message_id] = parsed
+        self._message_cache.move_to_end(message_id)
+        while len(self._message_cache) > settings.GMAIL_MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+        return parsed
+        
+    def _authorized_http(self):
+        """Return the calling thread's authorized HTTP connection"""
+        # httplib2.Http is not thread-safe, so each worker thread keeps its
+        # own and reuses it, keeping the TLS connection to Gmail alive.
+        # Without a timeout a stalled socket pins a fetch slot indefinitely.
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.creds,
+                http=httplib2.Http(timeout=settings.GMAIL_API_TIMEOUT)
+            )
+            self._local.http = http
+        return http
+        
+    def _refresh_credentials(self):
+        """Refresh the OAuth access token over the calling thread's connection"""
+        self.creds.refresh(
+            google_auth_httplib2.Request(self._authorized_http().http)
         )
-        sender = next(
-            (h["value"] for h in headers if h["name"].lower() == "from"),
-            ""
+        
+    def _list_messages(self, query: str = None):
+        """List message ids matching the query"""
+        return (
+            self.messages_resource
+            .list(userId="me", q=query, fields=LIST_FIELDS)
+            .execute(
+                http=self._authorized_http(),
+                num_retries=settings.GMAIL_API_NUM_RETRIES
+            )
         )
         
+    def _get_message(self, message_id):
+        """Fetch a single full message"""
+        return (
+            self.messages_resource
+            .get(
+                userId="me",
+                id=message_id,
+                format="full",
+                fields=MESSAGE_FIELDS
+            )
+            .execute(
+                http=self._authorized_http(),
+                num_retries=settings.GMAIL_API_NUM_RETRIES
+            )
+        )
+        
+    def _parse_message(self, message):
+        """Parse Gmail message into structured format"""
+        # Single pass over the headers; the first occurrence of a name wins
+        headers = {}
+        for h in message["payload"]["headers"]:
+            headers.setdefault(h["name"].lower(), h["value"])
+        subject = headers.get("subject", "")
+        sender = headers.get("from", "")
+        
         parts = message["payload"].get("parts", [])
         body = ""
         
@@ -6,7 +6,7 @@ class SLATracker:
     def __init__(self, db: Session):
         self.db = db
         
-    async def check_sla_breaches(self):
+    def check_sla_breaches(self):
         """Check for SLA breaches in email response times"""
         # Example SLA rules
         sla_rules = {
@@ -17,7 +17,7 @@ class SLATracker:
         
         # Implement SLA checking logic here
         
-    async def create_sla_alert(self, email_id: int, message: str):
+    def create_sla_alert(self, email_id: int, message: str):
         """Create an SLA breach alert"""
         alert = Alert(
             type=AlertType.SLA_BREACH,
@@ -25,5 +25,5 @@ class SLATracker:
             message=message
         )
         self.db.add(alert)
-        await self.db.commit()
+        self.db.commit()
         return alert